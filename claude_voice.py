@@ -11,14 +11,19 @@ import sys
 import time
 import wave
 import tempfile
+import io
+import math
 import subprocess
 import logging
 import struct
+import fcntl
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 import threading
 import queue
+import collections
+import re
 
 import yaml
 import numpy as np
@@ -32,6 +37,16 @@ pvporcupine = None
 # Project root directory
 PROJECT_DIR = Path(__file__).parent.resolve()
 
+# Transient per-command files live in the system temp dir; logs/ only keeps
+# the persistent daemon log and command history
+CANCEL_FILE = Path(tempfile.gettempdir()) / "hey-claude.cancel"
+
+# macOS read-ahead advisory fcntl (not exposed by the fcntl module)
+F_RDADVISE = getattr(fcntl, "F_RDADVISE", 44)
+
+# Whisper resamples everything to 16 kHz mono, so upload in that format
+WHISPER_SAMPLE_RATE = 16000
+
 
 def load_config() -> dict:
     """Load configuration from config.yaml, with environment variable overrides"""
@@ -83,6 +98,31 @@ def setup_logging(config: dict) -> logging.Logger:
     return logger
 
 
+# Use a Numba-compiled loop when available (optional, see README); it
+# auto-vectorizes to SIMD multiply-accumulate (NEON on Apple Silicon, AVX2 on
+# x86). No on-disk cache: the daemon compiles it once at startup, and bundled
+# apps have no cache dir, so numba adds its import + JIT time to each start.
+try:
+    from numba import njit
+except ImportError:
+    _ssq = None
+else:
+    @njit
+    def _ssq(x):
+        s = 0
+        for i in range(x.shape[0]):
+            v = np.int64(x[i])
+            s += v * v
+        return s
+
+
+def sum_of_squares(samples: np.ndarray) -> int:
+    """Signal energy of a 1-D int16 buffer, accumulated in int64 to avoid overflow"""
+    if _ssq is not None:
+        return int(_ssq(samples))
+    return int(np.einsum("i,i->", samples, samples, dtype=np.int64))
+
+
 class AudioRecorder:
     """Handles audio recording with silence detection"""
 
@@ -96,77 +136,74 @@ class AudioRecorder:
         self.end_keyword = config["command"]["end_keyword"].lower()
         self.input_device = config["audio"].get("input_device", "default")
 
-        # Audio buffer
-        self.audio_buffer = []
+        # Chunk sizing for the record loop
+        self.chunk_duration = 0.1  # 100ms chunks
+        self.chunk_samples = int(self.sample_rate * self.chunk_duration)
+
+        # Preallocated audio buffer (max duration plus one chunk of headroom),
+        # filled in place so recording does no per-chunk allocation
+        self._buf = np.empty(
+            (int(self.max_duration * self.sample_rate) + self.chunk_samples, self.channels),
+            dtype=np.int16
+        )
+        self._n = 0
         self.is_recording = False
 
-    def record_command(self) -> Optional[str]:
+        # Long-lived recording stream, opened on first use
+        self._stream = None
+        self._warned_no_scipy = False
+
+        # Silence detection: compare sum of squares against threshold² * N
+        # rather than taking the RMS, so no float temporary or sqrt is needed
+        self.silence_threshold = 500  # RMS threshold for silence
+        self._sil_sq_thresh = (self.silence_threshold ** 2) * self.chunk_samples * self.channels
+
+        # Start beep (short 440Hz tone), generated once and replayed per command
+        t = np.linspace(0, 0.1, 4410, False, dtype=np.float32)
+        self._beep = (np.sin(2 * np.pi * 440 * t) * 0.3 * 32767).astype(np.int16)
+
+    def record_command(
+        self,
+        read_frame: Optional[Callable[[], np.ndarray]] = None,
+        discard_pending: Optional[Callable[[], None]] = None
+    ) -> Optional[bytes]:
         """
         Record audio until silence is detected or max duration reached.
-        Returns path to temporary WAV file. Uses specific input device to avoid
+        Returns the recording as in-memory WAV bytes. Uses specific input device to avoid
         Bluetooth audio quality degradation.
+
+        If read_frame is given, audio is pulled from it (frames of an already
+        running stream in the recorder's format) instead of the recorder's own stream.
+        discard_pending is called once the start beep has finished, so that source
+        can drop frames captured while the audio cues were playing.
         """
-        self.audio_buffer = []
+        self._n = 0
         self.is_recording = True
 
-        # Calculate frames
-        chunk_duration = 0.1  # 100ms chunks
-        chunk_samples = int(self.sample_rate * chunk_duration)
-
-        # Silence detection parameters
-        silence_threshold = 500  # RMS threshold for silence
-        silence_chunks = 0
-        silence_chunks_needed = int(self.silence_timeout / chunk_duration)
-
-        start_time = time.time()
-
         self.logger.info("Recording command... (say 'over' or pause to finish)")
 
         # Play a short beep to indicate recording started
         self._play_start_sound()
 
-        # Cancel flag file path
-        cancel_file = PROJECT_DIR / "logs" / ".cancel_command"
-
         try:
-            with sd.InputStream(
-                device=self.input_device,  # Use specific device, not system default
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=np.int16,
-                blocksize=chunk_samples
-            ) as stream:
-                while self.is_recording:
-                    # Check if user cancelled via notification
-                    if cancel_file.exists():
-                        self.logger.info("Command cancelled by user")
-                        cancel_file.unlink(missing_ok=True)
-                        self.audio_buffer = []
-                        return None
-
-                    # Check max duration
-                    elapsed = time.time() - start_time
-                    if elapsed >= self.max_duration:
-                        self.logger.info(f"Max duration ({self.max_duration}s) reached")
-                        break
-
-                    # Read audio chunk
-                    chunk, _ = stream.read(chunk_samples)
-                    self.audio_buffer.append(chunk.copy())
-
-                    # Calculate RMS for silence detection
-                    rms = np.sqrt(np.mean(chunk.astype(np.float32) ** 2))
-
-                    if rms < silence_threshold:
-                        silence_chunks += 1
-                        if silence_chunks >= silence_chunks_needed:
-                            self.logger.info(f"Silence detected after {elapsed:.1f}s")
-                            break
-                    else:
-                        silence_chunks = 0
+            if read_frame is not None:
+                if discard_pending is not None:
+                    discard_pending()
+                completed = self._record(read_frame)
+            else:
+                # The stream is opened once and only started/stopped per command
+                if self._stream is None:
+                    self._stream = self._open_stream()
+                stream = self._stream
+                stream.start()
+                try:
+                    completed = self._record(lambda: stream.read(self.chunk_samples)[0])
+                finally:
+                    stream.stop()
 
         except sd.PortAudioError as e:
             self.logger.error(f"Audio device error: {e}")
+            self.close()
             return None
         except Exception as e:
             self.logger.error(f"Recording error: {e}")
@@ -174,41 +211,138 @@ class AudioRecorder:
 
         self.is_recording = False
 
-        if not self.audio_buffer:
+        if not completed or not self._n:
             return None
 
         return self._save_to_wav()
 
-    def _save_to_wav(self) -> str:
-        """Save recorded audio buffer to a temporary WAV file"""
-        # Concatenate all chunks
-        audio_data = np.concatenate(self.audio_buffer)
+    def _record(self, read_frame: Callable[[], np.ndarray]) -> bool:
+        """
+        Fill the buffer from read_frame until silence, max duration or cancel.
+        Frames may be any length; silence is evaluated per complete 100ms chunk.
+        Returns False if the user cancelled.
+        """
+        chunk_samples = self.chunk_samples
+        channels = self.channels
 
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix=".wav",
-            delete=False,
-            dir=PROJECT_DIR / "logs"
+        # Silence detection parameters
+        silence_chunks = 0
+        silence_chunks_needed = int(self.silence_timeout / self.chunk_duration)
+        sil_sq_thresh = self._sil_sq_thresh
+        chunk_start = 0  # Start of the next chunk awaiting silence detection
+
+        # Loop invariants hoisted out of the read loop
+        buf = self._buf
+        capacity = len(buf) - chunk_samples
+        monotonic = time.monotonic
+        cancel_file = CANCEL_FILE
+
+        deadline = monotonic() + self.max_duration
+
+        while self.is_recording:
+            # Check if user cancelled via notification
+            if cancel_file.exists():
+                self.logger.info("Command cancelled by user")
+                cancel_file.unlink(missing_ok=True)
+                self._n = 0
+                return False
+
+            # Check max duration
+            if self._n > capacity or monotonic() >= deadline:
+                self.logger.info(f"Max duration ({self.max_duration}s) reached")
+                break
+
+            # Copy the frame straight into the preallocated buffer
+            frame = read_frame().reshape(-1, channels)
+            buf[self._n:self._n + len(frame)] = frame
+            self._n += len(frame)
+
+            while self._n - chunk_start >= chunk_samples:
+                energy = sum_of_squares(buf[chunk_start:chunk_start + chunk_samples].reshape(-1))
+                chunk_start += chunk_samples
+                if energy < sil_sq_thresh:
+                    silence_chunks += 1
+                else:
+                    silence_chunks = 0
+
+            if silence_chunks >= silence_chunks_needed:
+                elapsed = self._n / self.sample_rate
+                self.logger.info(f"Silence detected after {elapsed:.1f}s")
+                break
+
+        return True
+
+    def _open_stream(self):
+        """Open the command recording stream on the configured input device"""
+        return sd.InputStream(
+            device=self.input_device,  # Use specific device, not system default
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            dtype=np.int16,
+            blocksize=self.chunk_samples,
+            latency="low"
         )
 
-        # Write WAV file
-        with wave.open(temp_file.name, "wb") as wf:
-            wf.setnchannels(self.channels)
+    def close(self):
+        """Close the recording stream, if open"""
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
+
+    def _save_to_wav(self) -> bytes:
+        """Encode the recorded audio buffer as 16 kHz mono WAV bytes in memory"""
+        audio_data = self._buf[:self._n]
+        channels = self.channels
+        sample_rate = self.sample_rate
+
+        # Downmix first so resampling only has to touch one channel
+        if channels > 1:
+            audio_data = audio_data.mean(axis=1).astype(np.int16)
+            channels = 1
+
+        if sample_rate != WHISPER_SAMPLE_RATE:
+            resampled = self._resample(audio_data.reshape(-1))
+            if resampled is not None:
+                audio_data = resampled
+                sample_rate = WHISPER_SAMPLE_RATE
+
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(channels)
             wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
+            wf.setframerate(sample_rate)
             wf.writeframes(audio_data.tobytes())
 
-        self.logger.debug(f"Saved audio to {temp_file.name}")
-        return temp_file.name
+        wav_bytes = buf.getvalue()
+        self.logger.debug(f"Encoded {len(wav_bytes)} bytes of audio")
+        return wav_bytes
+
+    def _resample(self, audio_data: np.ndarray) -> Optional[np.ndarray]:
+        """Resample mono int16 audio to Whisper's 16 kHz (requires scipy)"""
+        try:
+            from scipy.signal import resample_poly
+        except ImportError:
+            if not self._warned_no_scipy:
+                self.logger.info(
+                    f"scipy not installed, uploading audio at {self.sample_rate} Hz "
+                    f"instead of {WHISPER_SAMPLE_RATE} Hz (pip3 install scipy)"
+                )
+                self._warned_no_scipy = True
+            return None
+
+        g = math.gcd(WHISPER_SAMPLE_RATE, self.sample_rate)
+        resampled = resample_poly(
+            audio_data.astype(np.float32), WHISPER_SAMPLE_RATE // g, self.sample_rate // g
+        )
+        return np.clip(resampled, -32768, 32767).astype(np.int16)
 
     def _play_start_sound(self):
         """Play a short beep to indicate recording started"""
         try:
-            # Generate a short 440Hz beep
-            duration = 0.1  # seconds
-            t = np.linspace(0, duration, int(44100 * duration), False)
-            beep = (np.sin(2 * np.pi * 440 * t) * 0.3 * 32767).astype(np.int16)
-            sd.play(beep, 44100)
+            sd.play(self._beep, 44100)
             sd.wait()
         except Exception as e:
             self.logger.debug(f"Could not play start sound: {e}")
@@ -223,34 +357,83 @@ class WhisperTranscriber:
         self.whisper_url = config["stt"]["whisper_url"]
         self.use_openai_fallback = config["stt"]["use_openai_fallback"]
 
-    def transcribe(self, audio_path: str) -> Optional[str]:
-        """Transcribe audio file to text"""
+        # Persistent session so each transcription reuses the kept-alive connection
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Optional in-process faster-whisper backend (int8 on CPU) instead of HTTP
+        self.backend = config["stt"].get("backend", "whispercpp")
+        self._fw = None
+        if self.backend == "fasterwhisper":
+            self._init_faster_whisper()
+
+    def _init_faster_whisper(self):
+        """Load the faster-whisper model, falling back to whisper.cpp on failure"""
+        model_size = self.config["stt"].get("model_size", "base.en")
+        try:
+            from faster_whisper import WhisperModel
+            self._fw = WhisperModel(model_size, device="cpu", compute_type="int8")
+            self.logger.info(f"faster-whisper backend loaded (model: {model_size})")
+        except Exception as e:
+            self.logger.error(f"Failed to load faster-whisper, using whisper.cpp server: {e}")
+            self.backend = "whispercpp"
+
+    def warm_up(self):
+        """Send 100ms of silence through the backend so the first command
+        doesn't pay model load / connection setup costs"""
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)  # 16-bit
+            wf.setframerate(WHISPER_SAMPLE_RATE)
+            wf.writeframes(bytes(WHISPER_SAMPLE_RATE // 10 * 2))
+
+        try:
+            if self._fw is not None:
+                segments, _ = self._fw.transcribe(io.BytesIO(buf.getvalue()), language="en")
+                list(segments)  # Segments are generated lazily
+            else:
+                self._session.post(
+                    self.whisper_url,
+                    files={"file": ("audio.wav", buf.getvalue(), "audio/wav")},
+                    data={"response_format": "text", "language": "en"},
+                    timeout=30
+                )
+            self.logger.debug("Whisper backend warmed up")
+        except Exception as e:
+            self.logger.debug(f"Whisper warm-up failed: {e}")
+
+    def transcribe(self, audio_bytes: bytes) -> Optional[str]:
+        """Transcribe WAV audio bytes to text"""
         # Try local Whisper first
-        text = self._transcribe_local(audio_path)
+        if self._fw is not None:
+            text = self._transcribe_faster_whisper(audio_bytes)
+        else:
+            text = self._transcribe_local(audio_bytes)
 
         if text is None and self.use_openai_fallback:
             self.logger.info("Local Whisper failed, trying OpenAI API...")
-            text = self._transcribe_openai(audio_path)
+            text = self._transcribe_openai(audio_bytes)
 
         return text
 
-    def _transcribe_local(self, audio_path: str) -> Optional[str]:
+    def _transcribe_local(self, audio_bytes: bytes) -> Optional[str]:
         """Transcribe using local whisper.cpp server"""
         try:
-            with open(audio_path, "rb") as f:
-                response = requests.post(
-                    self.whisper_url,
-                    files={"file": ("audio.wav", f, "audio/wav")},
-                    data={
-                        "response_format": "json",
-                        "language": "en"
-                    },
-                    timeout=30
-                )
+            response = self._session.post(
+                self.whisper_url,
+                files={"file": ("audio.wav", audio_bytes, "audio/wav")},
+                data={
+                    "response_format": "text",
+                    "language": "en"
+                },
+                timeout=30
+            )
 
             if response.status_code == 200:
-                result = response.json()
-                text = result.get("text", "").strip()
+                text = response.text.strip()
                 self.logger.debug(f"Whisper transcription: {text}")
                 return text
             else:
@@ -265,18 +448,30 @@ class WhisperTranscriber:
             self.logger.error(f"Transcription error: {e}")
             return None
 
-    def _transcribe_openai(self, audio_path: str) -> Optional[str]:
+    def _transcribe_faster_whisper(self, audio_bytes: bytes) -> Optional[str]:
+        """Transcribe in-process using faster-whisper"""
+        try:
+            segments, _ = self._fw.transcribe(io.BytesIO(audio_bytes), language="en", vad_filter=True)
+            text = " ".join(s.text for s in segments).strip()
+            self.logger.debug(f"faster-whisper transcription: {text}")
+            return text
+        except Exception as e:
+            self.logger.error(f"Transcription error: {e}")
+            return None
+
+    def _transcribe_openai(self, audio_bytes: bytes) -> Optional[str]:
         """Transcribe using OpenAI Whisper API"""
         try:
             import openai
 
             client = openai.OpenAI()
-            with open(audio_path, "rb") as f:
-                transcript = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=f,
-                    response_format="text"
-                )
+            f = io.BytesIO(audio_bytes)
+            f.name = "audio.wav"  # Lets the client infer the upload format
+            transcript = client.audio.transcriptions.create(
+                model="whisper-1",
+                file=f,
+                response_format="text"
+            )
             return transcript.strip()
 
         except Exception as e:
@@ -284,6 +479,48 @@ class WhisperTranscriber:
             return None
 
 
+# AppleScripts for opening a terminal session. The shell command is passed as a
+# handler argument (no escaping needed); the run handler lets osascript invoke
+# the same script with the command as argv when OSAKit is unavailable.
+ITERM_APPLESCRIPT = '''
+on launch_command(shell_cmd)
+    tell application "iTerm"
+        activate
+        if (count of windows) > 0 then
+            tell current window
+                create tab with default profile
+                tell current session
+                    write text shell_cmd
+                end tell
+            end tell
+        else
+            create window with default profile
+            tell current session of current window
+                write text shell_cmd
+            end tell
+        end if
+    end tell
+end launch_command
+
+on run argv
+    launch_command(item 1 of argv)
+end run
+'''
+
+TERMINAL_APPLESCRIPT = '''
+on launch_command(shell_cmd)
+    tell application "Terminal"
+        activate
+        do script shell_cmd
+    end tell
+end launch_command
+
+on run argv
+    launch_command(item 1 of argv)
+end run
+'''
+
+
 class ClaudeLauncher:
     """Handles launching Claude Code with voice commands"""
 
@@ -295,6 +532,15 @@ class ClaudeLauncher:
         self.end_keyword = config["command"]["end_keyword"].lower()
         self.terminal_app = config.get("terminal", {}).get("app", "iterm")
 
+        # Matches the end keyword as the final word, with trailing punctuation
+        self._end_re = re.compile(
+            rf"(?:^|\s+){re.escape(self.end_keyword)}[.,!?]*\s*$",
+            re.IGNORECASE
+        )
+
+        # Precompiled launch scripts (empty if pyobjc is missing)
+        self._scripts = self._compile_scripts()
+
     def launch(self, command: str) -> bool:
         """Launch Claude Code in a new iTerm/Terminal window with voice mode"""
         # Remove end keyword from command if present
@@ -311,13 +557,18 @@ class ClaudeLauncher:
 
 Voice command: "{command}"'''
 
-        # Write prompt to temp file to avoid escaping issues
-        prompt_file = PROJECT_DIR / "logs" / ".current_prompt.txt"
-        prompt_file.parent.mkdir(parents=True, exist_ok=True)
-        prompt_file.write_text(prompt)
+        # Write prompt to its own temp file to avoid escaping issues. Launches can
+        # run back to back, and each tab reads its file only once its shell starts,
+        # so a shared file could be overwritten first; the shell deletes it after reading.
+        fd, prompt_file = tempfile.mkstemp(prefix="hey-claude-prompt-", suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write(prompt)
 
         # Build the shell command (no -p flag for interactive mode)
-        shell_cmd = f'cd "{self.working_dir}" && {self.binary_path} "$(cat "{prompt_file}")"'
+        shell_cmd = (
+            f'cd "{self.working_dir}" && '
+            f'{self.binary_path} "$(cat "{prompt_file}"; rm -f "{prompt_file}")"'
+        )
 
         try:
             if self.terminal_app == "iterm":
@@ -328,62 +579,61 @@ Voice command: "{command}"'''
             self.logger.error(f"Failed to launch Claude: {e}")
             return False
 
+    def _compile_scripts(self) -> dict:
+        """Compile the launch AppleScripts once via OSAKit, if pyobjc is available"""
+        try:
+            from OSAKit import OSAScript, OSALanguage
+        except ImportError:
+            self.logger.debug("pyobjc OSAKit not available, launching via osascript")
+            return {}
+
+        language = OSALanguage.languageForName_("AppleScript")
+        scripts = {}
+        for name, source in (("iterm", ITERM_APPLESCRIPT), ("terminal", TERMINAL_APPLESCRIPT)):
+            script = OSAScript.alloc().initWithSource_language_(source, language)
+            compiled, error = script.compileAndReturnError_(None)
+            if compiled:
+                scripts[name] = script
+            else:
+                self.logger.warning(f"Could not compile {name} AppleScript: {error}")
+        return scripts
+
+    def _run_applescript(self, name: str, source: str, shell_cmd: str):
+        """Run a launch script's handler with the shell command as its argument"""
+        script = self._scripts.get(name)
+        if script is not None:
+            from Foundation import NSAppleEventDescriptor
+            arg = NSAppleEventDescriptor.descriptorWithString_(shell_cmd)
+            _, error = script.executeHandlerWithName_arguments_error_("launch_command", [arg], None)
+            if error is not None:
+                raise RuntimeError(str(error))
+            return
+
+        try:
+            subprocess.run(["osascript", "-e", source, shell_cmd], check=True, capture_output=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(e.stderr.decode().strip())
+
     def _launch_iterm(self, shell_cmd: str) -> bool:
         """Launch in iTerm2 - new tab if window exists, otherwise new window"""
-        escaped_cmd = shell_cmd.replace('"', '\\"')
-        applescript = f'''
-        tell application "iTerm"
-            activate
-            if (count of windows) > 0 then
-                tell current window
-                    create tab with default profile
-                    tell current session
-                        write text "{escaped_cmd}"
-                    end tell
-                end tell
-            else
-                create window with default profile
-                tell current session of current window
-                    write text "{escaped_cmd}"
-                end tell
-            end if
-        end tell
-        '''
         try:
-            subprocess.run(["osascript", "-e", applescript], check=True, capture_output=True)
+            self._run_applescript("iterm", ITERM_APPLESCRIPT, shell_cmd)
             self.logger.info("Claude Code launched in iTerm")
             return True
-        except subprocess.CalledProcessError as e:
-            self.logger.warning(f"iTerm failed, trying Terminal: {e.stderr.decode()}")
+        except RuntimeError as e:
+            self.logger.warning(f"iTerm failed, trying Terminal: {e}")
             return self._launch_terminal(shell_cmd)
 
     def _launch_terminal(self, shell_cmd: str) -> bool:
         """Launch in Terminal.app"""
-        escaped_cmd = shell_cmd.replace('"', '\\"')
-        applescript = f'''
-        tell application "Terminal"
-            activate
-            do script "{escaped_cmd}"
-        end tell
-        '''
-        subprocess.run(["osascript", "-e", applescript], check=True, capture_output=True)
+        self._run_applescript("terminal", TERMINAL_APPLESCRIPT, shell_cmd)
         self.logger.info("Claude Code launched in new Terminal window")
         return True
 
     def _clean_command(self, command: str) -> str:
         """Remove end keyword and clean up the command"""
-        # Remove "over" from the end (case-insensitive)
-        words = command.split()
-        if words and words[-1].lower().rstrip(".,!?") == self.end_keyword:
-            words = words[:-1]
-
-        # Also check for "over" with punctuation anywhere at the end
-        cleaned = " ".join(words).strip()
-
-        # Remove trailing punctuation that might remain
-        cleaned = cleaned.rstrip(".,!?")
-
-        return cleaned
+        # Remove "over" from the end (case-insensitive), then any trailing punctuation
+        return self._end_re.sub("", command).strip().rstrip(".,!?")
 
 
 class VoiceCommandDaemon:
@@ -419,18 +669,82 @@ class VoiceCommandDaemon:
         self.porcupine = None
         self._init_porcupine()
 
+        # Warm up to avoid first-use latency spikes: run Porcupine once on a
+        # silent frame, force PortAudio device enumeration, JIT the energy
+        # reduction, and prime the Whisper backend in the background so
+        # startup isn't delayed
+        self.porcupine.process(np.zeros(self.porcupine.frame_length, dtype=np.int16))
+        sd.query_devices()
+        # Compile the energy reduction for both writable (recorder) and
+        # read-only (np.frombuffer wake frames) int16 arrays
+        sum_of_squares(np.zeros(1, dtype=np.int16))
+        sum_of_squares(np.frombuffer(bytes(2), dtype=np.int16))
+        threading.Thread(target=self.transcriber.warm_up, name="whisper-warmup", daemon=True).start()
+
+        # Long-lived wake word stream; its callback fills a small ring of
+        # Porcupine-sized frames that the main loop drains
+        self.input_device = self.config["audio"].get("input_device", "MacBook Pro Microphone")
+        self._wake_stream = None
+        self._ring = collections.deque(maxlen=32)
+
+        # When the recorder's format matches the wake stream (same device,
+        # Porcupine's sample rate, mono), commands are recorded from the same
+        # always-on stream: no stream switch, no audio lost after the wake word
+        self._shared_capture = (
+            self.recorder.input_device == self.input_device
+            and self.recorder.sample_rate == self.porcupine.sample_rate
+            and self.recorder.channels == 1
+        )
+
+        # Energy gate in front of Porcupine: frames below 3x an adaptive noise
+        # floor skip inference. The floor is seeded from the first second of audio.
+        # Once a frame passes, the gate stays open for a hold window, and the
+        # last few gated frames are replayed as pre-roll, so Porcupine sees the
+        # quiet onset and pauses of the wake phrase as one continuous signal.
+        frames_per_second = self.porcupine.sample_rate / self.porcupine.frame_length
+        self._noise_floor = 0.0
+        self._noise_frames = 0
+        self._noise_calibration_frames = int(frames_per_second)
+        self._gate_hold_frames = int(0.75 * frames_per_second)
+        self._gate_hold = 0
+        self._preroll = collections.deque(maxlen=4)
+
         self.running = False
         self.cancel_requested = False  # Flag for notification cancel button
+        self._chime_proc = None  # Wake chime player, waited on before recording
+
+        # Command history is appended through one line-buffered handle
+        history_file = PROJECT_DIR / "logs" / "command_history.log"
+        history_file.parent.mkdir(parents=True, exist_ok=True)
+        self._hist = open(history_file, "a", buffering=1, encoding="utf-8")
+
+        # Transcription + launch run on a worker thread so the main loop can
+        # return to wake word listening as soon as recording finishes
+        self._jobs = queue.Queue()
+        self._worker_thread = threading.Thread(target=self._worker, name="command-worker", daemon=True)
+        self._worker_thread.start()
 
     def _init_porcupine(self):
         """Initialize Porcupine wake word detector"""
         access_key = self.config["picovoice"]["access_key"]
-        model_path = PROJECT_DIR / self.config["picovoice"]["wake_word_model"]
+        model_path = (PROJECT_DIR / self.config["picovoice"]["wake_word_model"]).resolve()
 
         if not model_path.exists():
             self.logger.error(f"Wake word model not found: {model_path}")
             sys.exit(1)
 
+        # Hint the OS to pull the model into the page cache ahead of Porcupine's read
+        try:
+            with open(model_path, "rb") as f:
+                if sys.platform == "darwin":
+                    # F_RDADVISE takes struct radvisory {off_t ra_offset; int ra_count;}
+                    size = os.fstat(f.fileno()).st_size
+                    fcntl.fcntl(f.fileno(), F_RDADVISE, struct.pack("qi4x", 0, size))
+                elif hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+
         try:
             sensitivity = self.config.get('picovoice', {}).get('sensitivity', 0.5)
             self.porcupine = pvporcupine.create(
@@ -454,47 +768,32 @@ class VoiceCommandDaemon:
         self.logger.info("Press Ctrl+C to stop")
         self.logger.info("=" * 50)
 
-        frame_length = self.porcupine.frame_length
-        sample_rate = self.porcupine.sample_rate
-        input_device = self.config["audio"].get("input_device", "MacBook Pro Microphone")
+        input_device = self.input_device
 
         try:
             while self.running:
-                # Open stream for wake word detection
                 try:
-                    with sd.InputStream(
-                        device=input_device,
-                        samplerate=sample_rate,
-                        channels=1,
-                        dtype=np.int16,
-                        blocksize=frame_length,
-                        latency='low'
-                    ) as stream:
-                        self.logger.info(f"Listening for 'Hey Claude'...")
-
-                        while self.running:
-                            # Read and process audio frame
-                            frame, _ = stream.read(frame_length)
-                            keyword_index = self.porcupine.process(frame.flatten())
-
-                            if keyword_index >= 0:
-                                self.logger.info("Wake word detected: 'Hey Claude'")
-                                # Play chime to indicate wake word detected
-                                self._play_chime()
-                                self.logger.debug("Chime played, closing audio stream...")
-                                break  # Exit stream context to close it before recording
-
-                    self.logger.debug("Audio stream closed")
-
-                    # If wake word was detected, handle command (stream is now closed)
-                    if keyword_index >= 0:
+                    # Open the wake word stream once; afterwards it is at most
+                    # paused for the recorder's own stream, never reopened
+                    if self._wake_stream is None:
+                        self._wake_stream = self._open_wake_stream(input_device)
+
+                    if not self._wake_stream.active:
+                        self._ring.clear()  # Drop audio left over from before the pause
+                        self._wake_stream.start()
+
+                    self.logger.info(f"Listening for 'Hey Claude'...")
+
+                    if self._listen_for_wake_word():
+                        self.logger.info("Wake word detected: 'Hey Claude'")
+                        # Play chime to indicate wake word detected
+                        self._play_chime()
                         self.logger.debug("Calling handle_command...")
                         self._handle_command()
                         self.logger.info("Ready for next command.")
-                        # Small delay before reopening stream
-                        time.sleep(0.3)
 
                 except sd.PortAudioError as e:
+                    self._close_wake_stream()
                     self.logger.error(f"Audio device error: {e}")
                     self.logger.error(f"Device '{input_device}' not found. Available devices:")
                     for d in sd.query_devices():
@@ -509,62 +808,160 @@ class VoiceCommandDaemon:
         finally:
             self.cleanup()
 
+    def _open_wake_stream(self, input_device):
+        """Open the raw wake word stream feeding the frame ring buffer"""
+        return sd.RawInputStream(
+            device=input_device,
+            samplerate=self.porcupine.sample_rate,
+            channels=1,
+            dtype="int16",
+            blocksize=self.porcupine.frame_length,
+            latency="low",
+            callback=self._on_wake_audio
+        )
+
+    def _on_wake_audio(self, indata, frames, time_info, status):
+        """PortAudio callback - copy the frame out and return immediately"""
+        self._ring.append(bytes(indata))
+
+    def _close_wake_stream(self):
+        """Close the wake word stream, if open"""
+        if self._wake_stream is not None:
+            try:
+                self._wake_stream.close()
+            except Exception:
+                pass
+            self._wake_stream = None
+
+    def _listen_for_wake_word(self) -> bool:
+        """Feed captured frames to Porcupine until the wake word is detected"""
+        # Gate state from before a command is stale
+        self._gate_hold = 0
+        self._preroll.clear()
+
+        while self.running:
+            try:
+                buf = self._ring.popleft()
+            except IndexError:
+                time.sleep(0.005)
+                continue
+
+            frame = np.frombuffer(buf, dtype=np.int16)
+
+            energy = sum_of_squares(frame)
+            if self._noise_frames < self._noise_calibration_frames:
+                self._noise_frames += 1
+                self._noise_floor += (energy - self._noise_floor) / self._noise_frames
+            elif energy >= 3 * self._noise_floor:
+                if not self._gate_hold:
+                    # Gate opening: replay the quiet lead-in first
+                    for prev in self._preroll:
+                        if self.porcupine.process(prev) >= 0:
+                            return True
+                    self._preroll.clear()
+                self._gate_hold = self._gate_hold_frames
+            elif self._gate_hold:
+                self._gate_hold -= 1
+            else:
+                self._noise_floor = 0.98 * self._noise_floor + 0.02 * energy
+                self._preroll.append(frame)
+                continue
+
+            if self.porcupine.process(frame) >= 0:
+                return True
+
+        return False
+
+    def _next_frame(self) -> np.ndarray:
+        """Block until the wake word stream delivers its next frame"""
+        deadline = time.monotonic() + 1.0
+        while True:
+            try:
+                return np.frombuffer(self._ring.popleft(), dtype=np.int16)
+            except IndexError:
+                if time.monotonic() >= deadline:
+                    raise RuntimeError("Wake word stream stopped delivering audio")
+                time.sleep(0.005)
+
+    def _discard_cue_audio(self):
+        """Drop shared-stream frames that captured the chime and start beep"""
+        if self._chime_proc is not None:
+            try:
+                self._chime_proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                pass
+            self._chime_proc = None
+        self._ring.clear()
+
     def _handle_command(self):
         """Handle a voice command after wake word detection"""
         # Record the command
-        audio_path = self.recorder.record_command()
-
-        if not audio_path:
+        if self._shared_capture:
+            audio = self.recorder.record_command(self._next_frame, self._discard_cue_audio)
+        else:
+            # Pause capture so the recorder can use the microphone
+            self._wake_stream.stop()
+            self.logger.debug("Wake word stream paused")
+            audio = self.recorder.record_command()
+
+        if not audio:
             self.logger.warning("No audio recorded")
             return
 
-        try:
-            # Transcribe the audio
-            command = self.transcriber.transcribe(audio_path)
+        # Hand off to the worker for transcription and launch
+        self._jobs.put(audio)
 
-            if not command:
-                self.logger.warning("Transcription failed or empty")
-                return
+    def _worker(self):
+        """Process recorded commands in order, one at a time"""
+        while True:
+            audio = self._jobs.get()
+            if audio is None:
+                break
+            try:
+                self._process_command(audio)
+            except Exception as e:
+                self.logger.error(f"Command processing error: {e}")
 
-            # Check for blank/empty transcriptions (Whisper returns these for silence/noise)
-            blank_patterns = [
-                "[BLANK_AUDIO]", "[blank_audio]", "(no speech)", "",
-                "(speaking in foreign language)", "(foreign language)",
-                "(music)", "(noise)", "(silence)", "(applause)", "(laughter)"
-            ]
-            cleaned_cmd = command.strip().lower()
-            if cleaned_cmd in [p.lower() for p in blank_patterns] or not cleaned_cmd:
-                self.logger.info("Blank audio detected, ignoring command")
-                return
+    def _process_command(self, audio: bytes):
+        """Transcribe a recorded command and launch Claude with it"""
+        # Transcribe the audio
+        command = self.transcriber.transcribe(audio)
 
-            self.logger.info(f"Transcribed command: {command}")
+        if not command:
+            self.logger.warning("Transcription failed or empty")
+            return
 
-            # Log the command
-            self._log_command(command)
+        # Check for blank/empty transcriptions (Whisper returns these for silence/noise)
+        blank_patterns = [
+            "[BLANK_AUDIO]", "[blank_audio]", "(no speech)", "",
+            "(speaking in foreign language)", "(foreign language)",
+            "(music)", "(noise)", "(silence)", "(applause)", "(laughter)"
+        ]
+        cleaned_cmd = command.strip().lower()
+        if cleaned_cmd in [p.lower() for p in blank_patterns] or not cleaned_cmd:
+            self.logger.info("Blank audio detected, ignoring command")
+            return
 
-            # Launch Claude with the command
-            self.launcher.launch(command)
+        self.logger.info(f"Transcribed command: {command}")
 
-        finally:
-            # Clean up temporary audio file
-            try:
-                os.unlink(audio_path)
-            except Exception:
-                pass
+        # Log the command
+        self._log_command(command)
+
+        # Launch Claude with the command
+        self.launcher.launch(command)
 
     def _play_chime(self):
         """Play a chime sound and show notification when wake word detected"""
         # Clear any previous cancel flag
         self.cancel_requested = False
-        cancel_file = PROJECT_DIR / "logs" / ".cancel_command"
         try:
-            cancel_file.unlink(missing_ok=True)
+            CANCEL_FILE.unlink(missing_ok=True)
         except Exception:
             pass
 
         try:
             # Play macOS system sound (non-blocking)
-            subprocess.Popen(
+            self._chime_proc = subprocess.Popen(
                 ["afplay", "/System/Library/Sounds/Pop.aiff"],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
@@ -590,23 +987,24 @@ class VoiceCommandDaemon:
         """Callback when Cancel button is clicked on notification"""
         self.cancel_requested = True
         # Also create cancel file for recording loop to detect
-        cancel_file = PROJECT_DIR / "logs" / ".cancel_command"
         try:
-            cancel_file.touch()
+            CANCEL_FILE.touch()
         except Exception:
             pass
 
     def _log_command(self, command: str):
         """Log command to history file"""
-        history_file = PROJECT_DIR / "logs" / "command_history.log"
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        with open(history_file, "a") as f:
-            f.write(f"[{timestamp}] {command}\n")
+        self._hist.write(f"[{timestamp}] {command}\n")
 
     def cleanup(self):
         """Clean up resources"""
         self.running = False
+        self._jobs.put(None)  # Stop the worker once queued commands finish
+        self._close_wake_stream()
+        self.recorder.close()
+        self._worker_thread.join(timeout=5)
+        self._hist.close()
         if self.porcupine:
             self.porcupine.delete()
             self.logger.info("Porcupine resources released")
@@ -14,10 +14,11 @@ DATA_FILES = [
 OPTIONS = {
     'argv_emulation': False,
     'iconfile': 'hey-claude.icns',
-    'packages': ['pvporcupine', 'sounddevice', 'numpy', 'requests', 'yaml', '_sounddevice_data'],
+    'packages': ['pvporcupine', 'sounddevice', 'numpy', 'requests', 'yaml', '_sounddevice_data', 'objc', 'Foundation', 'OSAKit'],
     'includes': ['_cffi_backend'],
     'frameworks': ['/opt/homebrew/lib/libportaudio.dylib'],
     'strip': False,  # Don't strip binaries
+    'optimize': 2,  # Bytecode without docstrings/asserts for faster startup
     'semi_standalone': False,
     'site_packages': True,
     'plist': {